@@ -17,7 +17,7 @@ class _BinaryDistribution(Distribution):
 install_requires = [
     "absl-py>=1.3.0,<2.0.0",
     "matplotlib>=3.7.1,<4.0.0",
-    "pandas>=1.5.2",
+    "pandas>=2.0",
     "protobuf>=3.20.3",
 ]
 
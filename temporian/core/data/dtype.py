@@ -84,13 +84,13 @@ class DType(Enum):
             ValueError: If there's no DType implemented for this type of value.
         """
 
-        try:
-            return PY_TYPE_TO_DTYPE[type(value)]
-        except KeyError as e:
+        dtype = PY_TYPE_TO_DTYPE.get(type(value))
+        if dtype is None:
             raise ValueError(
                 f"Couldn't find a dtype to store a value of type {type(value)}."
                 f" Value is: {value}"
-            ) from e
+            )
+        return dtype
 
 
 PY_TYPE_TO_DTYPE = {
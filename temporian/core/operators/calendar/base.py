@@ -15,8 +15,8 @@
 """Base calendar operator class definition."""
 import pytz
 import datetime
-from typing import Union
-from abc import ABC, abstractmethod
+from typing import ClassVar, Union
+from abc import ABC
 
 from temporian.core.data.dtype import DType
 from temporian.core.data.node import (
@@ -49,6 +49,12 @@ def timezone_to_utc_offset(timezone: Union[str, float, int]) -> float:
 class BaseCalendarOperator(Operator, ABC):
     """Interface definition and common logic for calendar operators."""
 
+    # Key of the operator definition, set by each subclass.
+    operator_def_key: ClassVar[str]
+
+    # Name of the generated feature in the output node, set by each subclass.
+    output_feature_name: ClassVar[str]
+
     def __init__(self, sampling: EventSetNode, utc_offset: float):
         super().__init__()
 
@@ -73,7 +79,7 @@ class BaseCalendarOperator(Operator, ABC):
         self.add_output(
             "output",
             create_node_new_features_existing_sampling(
-                features=[(self.output_feature_name(), DType.INT32)],
+                features=[(self.output_feature_name, DType.INT32)],
                 sampling_node=sampling,
                 creator=self,
             ),
@@ -83,7 +89,7 @@ class BaseCalendarOperator(Operator, ABC):
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
         return pb.OperatorDef(
-            key=cls.operator_def_key(),
+            key=cls.operator_def_key,
             inputs=[pb.OperatorDef.Input(key="sampling")],
             attributes=[
                 pb.OperatorDef.Attribute(
@@ -98,13 +104,3 @@ class BaseCalendarOperator(Operator, ABC):
     def utc_offset(self) -> float:
         """Gets timezone offset from UTC, in hours."""
         return self._utc_offset
-
-    @classmethod
-    @abstractmethod
-    def operator_def_key(cls) -> str:
-        """Gets the key of the operator definition."""
-
-    @classmethod
-    @abstractmethod
-    def output_feature_name(cls) -> str:
-        """Gets the name of the generated feature in the output node."""
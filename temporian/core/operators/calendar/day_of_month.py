@@ -13,7 +13,7 @@
 # limitations under the License.
 
 """Calendar day of month operator class and public API function definitions."""
-from typing import Union
+from typing import ClassVar, Union
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
@@ -25,13 +25,8 @@ from temporian.core.typing import EventSetOrNode
 
 
 class CalendarDayOfMonthOperator(BaseCalendarOperator):
-    @classmethod
-    def operator_def_key(cls) -> str:
-        return "CALENDAR_DAY_OF_MONTH"
-
-    @classmethod
-    def output_feature_name(cls) -> str:
-        return "calendar_day_of_month"
+    operator_def_key: ClassVar[str] = "CALENDAR_DAY_OF_MONTH"
+    output_feature_name: ClassVar[str] = "calendar_day_of_month"
 
 
 operator_lib.register_operator(CalendarDayOfMonthOperator)
@@ -14,7 +14,7 @@
 
 """Calendar day of year operator class and public API function definitions."""
 
-from typing import Union
+from typing import ClassVar, Union
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
@@ -26,13 +26,8 @@ from temporian.core.typing import EventSetOrNode
 
 
 class CalendarDayOfYearOperator(BaseCalendarOperator):
-    @classmethod
-    def operator_def_key(cls) -> str:
-        return "CALENDAR_DAY_OF_YEAR"
-
-    @classmethod
-    def output_feature_name(cls) -> str:
-        return "calendar_day_of_year"
+    operator_def_key: ClassVar[str] = "CALENDAR_DAY_OF_YEAR"
+    output_feature_name: ClassVar[str] = "calendar_day_of_year"
 
 
 operator_lib.register_operator(CalendarDayOfYearOperator)
@@ -14,7 +14,7 @@
 
 """Calendar ISO week operator class and public API function definitions."""
 
-from typing import Union
+from typing import ClassVar, Union
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
@@ -26,13 +26,8 @@ from temporian.core.typing import EventSetOrNode
 
 
 class CalendarISOWeekOperator(BaseCalendarOperator):
-    @classmethod
-    def operator_def_key(cls) -> str:
-        return "CALENDAR_ISO_WEEK"
-
-    @classmethod
-    def output_feature_name(cls) -> str:
-        return "calendar_iso_week"
+    operator_def_key: ClassVar[str] = "CALENDAR_ISO_WEEK"
+    output_feature_name: ClassVar[str] = "calendar_iso_week"
 
 
 operator_lib.register_operator(CalendarISOWeekOperator)
@@ -14,7 +14,7 @@
 
 """Calendar minute operator class and public API function definitions."""
 
-from typing import Union
+from typing import ClassVar, Union
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
@@ -26,13 +26,8 @@ from temporian.core.typing import EventSetOrNode
 
 
 class CalendarMinuteOperator(BaseCalendarOperator):
-    @classmethod
-    def operator_def_key(cls) -> str:
-        return "CALENDAR_MINUTE"
-
-    @classmethod
-    def output_feature_name(cls) -> str:
-        return "calendar_minute"
+    operator_def_key: ClassVar[str] = "CALENDAR_MINUTE"
+    output_feature_name: ClassVar[str] = "calendar_minute"
 
 
 operator_lib.register_operator(CalendarMinuteOperator)
@@ -14,7 +14,7 @@
 
 """Calendar month operator class and public API function definitions."""
 
-from typing import Union
+from typing import ClassVar, Union
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import EventSetNode
@@ -26,13 +26,8 @@ from temporian.core.typing import EventSetOrNode
 
 
 class CalendarMonthOperator(BaseCalendarOperator):
-    @classmethod
-    def operator_def_key(cls) -> str:
-        return "CALENDAR_MONTH"
-
-    @classmethod
-    def output_feature_name(cls) -> str:
-        return "calendar_month"
+    operator_def_key: ClassVar[str] = "CALENDAR_MONTH"
+    output_feature_name: ClassVar[str] = "calendar_month"
 
 
 operator_lib.register_operator(CalendarMonthOperator)
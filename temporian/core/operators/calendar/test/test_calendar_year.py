@@ -42,6 +42,22 @@ class CalendarYearTest(TestCase):
         result = evset.calendar_year()
         assertOperatorResult(self, result, expected)
 
+    def test_outside_datetime64_ns_range(self):
+        """Timestamps outside the years ~1677-2262 don't fit in a
+        nanosecond-resolution datetime64 and must not overflow."""
+        timestamps = [1e10, -1e10]  # years 2286 and 1653
+        evset = event_set(timestamps=timestamps, is_unix_timestamp=True)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={"calendar_year": i32([2286, 1653])},
+            is_unix_timestamp=True,
+            same_sampling_as=evset,
+        )
+
+        result = evset.calendar_year()
+        assertOperatorResult(self, result, expected)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -15,7 +15,7 @@
 
 """Combine operator class and public API function definitions."""
 from enum import Enum
-from typing import Any, Union
+from typing import Any, ClassVar, Optional, Union
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
@@ -65,20 +65,29 @@ class Combine(Operator):
 
         # inputs
         first_input = None
-        all_unix_timestamp = True
+        ref_features = None
         for key, input in inputs.items():
-            # Check that all features are in all nodes
             if first_input is None:
                 first_input = input
-            first_input.schema.check_compatible_features(
-                input.schema, check_order=False
-            )
-            first_input.schema.check_compatible_index(input.schema)
+                ref_features = set(input.schema.features)
+            else:
+                # Check that all features are in all nodes. The feature set of
+                # the first input is built only once; the slow path is only
+                # taken to raise the detailed error message.
+                if set(input.schema.features) != ref_features:
+                    first_input.schema.check_compatible_features(
+                        input.schema, check_order=False
+                    )
+                first_input.schema.check_compatible_index(input.schema)
 
-            # Output is unix if all inputs are
-            all_unix_timestamp &= input.schema.is_unix_timestamp
             self.add_input(key, input)
 
+        # Output is unix if all inputs are. all() short-circuits on the first
+        # non-unix input.
+        all_unix_timestamp = all(
+            inp.schema.is_unix_timestamp for inp in inputs.values()
+        )
+
         assert first_input is not None  # for static checker
         self.add_output(
             "output",
@@ -95,19 +104,25 @@ class Combine(Operator):
     def how(self) -> str:
         return self._how
 
+    # Operator definition, built once on first use. The definition is only
+    # read, so sharing one proto across instances is safe.
+    _cached_op_def: ClassVar[Optional[pb.OperatorDef]] = None
+
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
-        return pb.OperatorDef(
-            key="COMBINE",
-            attributes=[
-                pb.OperatorDef.Attribute(
-                    key="how",
-                    type=pb.OperatorDef.Attribute.Type.STRING,
-                ),
-            ],
-            inputs=[pb.OperatorDef.Input(key_prefix=_INPUT_KEY_PREFIX)],
-            outputs=[pb.OperatorDef.Output(key="output")],
-        )
+        if cls._cached_op_def is None:
+            cls._cached_op_def = pb.OperatorDef(
+                key="COMBINE",
+                attributes=[
+                    pb.OperatorDef.Attribute(
+                        key="how",
+                        type=pb.OperatorDef.Attribute.Type.STRING,
+                    ),
+                ],
+                inputs=[pb.OperatorDef.Input(key_prefix=_INPUT_KEY_PREFIX)],
+                outputs=[pb.OperatorDef.Output(key="output")],
+            )
+        return cls._cached_op_def
 
 
 operator_lib.register_operator(Combine)
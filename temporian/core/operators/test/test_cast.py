@@ -128,6 +128,36 @@ class CastTest(parameterized.TestCase):
                 check_overflow=True,
             )
 
+    def test_overflow_with_nan(self) -> None:
+        """Test that NaNs don't mask out-of-range values."""
+        evset = event_set(
+            timestamps=[0, 1],
+            features={"a": f64([1e40, np.nan])},
+        )
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            evset.cast({"a": DType.FLOAT32}, check_overflow=True)
+
+        evset = event_set(
+            timestamps=[0, 1],
+            features={"a": f64([1e10, np.nan])},
+        )
+        with self.assertRaisesRegex(ValueError, "Overflow"):
+            evset.cast({"a": DType.INT32}, check_overflow=True)
+
+    def test_no_overflow_nan(self) -> None:
+        """Test that NaNs alone don't trigger the overflow check."""
+        evset = event_set(
+            timestamps=[0, 1],
+            features={"a": f64([1.0, np.nan])},
+        )
+        result = evset.cast({"a": DType.FLOAT32}, check_overflow=True)
+        expected = event_set(
+            timestamps=[0, 1],
+            features={"a": f32([1.0, np.nan])},
+            same_sampling_as=evset,
+        )
+        assertOperatorResult(self, result, expected)
+
     def test_no_overflow_boolean(self) -> None:
         """Test that no overflow error is raised when
         converting to boolean type"""
@@ -14,7 +14,7 @@
 
 
 """Where operator class and public API function definitions."""
-from typing import Tuple, Union, Any, Optional
+from typing import ClassVar, Tuple, Union, Any, Optional
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
@@ -144,9 +144,15 @@ class Where(Operator):
 
         return dtype, is_node
 
+    # Operator definition, built once on first use. The definition is only
+    # read, so sharing one proto across instances is safe.
+    _cached_op_def: ClassVar[Optional[pb.OperatorDef]] = None
+
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
-        return pb.OperatorDef(
+        if cls._cached_op_def is not None:
+            return cls._cached_op_def
+        cls._cached_op_def = pb.OperatorDef(
             key="WHERE",
             attributes=[
                 pb.OperatorDef.Attribute(
@@ -167,6 +173,7 @@ class Where(Operator):
             ],
             outputs=[pb.OperatorDef.Output(key="output")],
         )
+        return cls._cached_op_def
 
     @property
     def on_true(self) -> Optional[Any]:
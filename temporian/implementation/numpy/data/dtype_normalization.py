@@ -287,7 +287,7 @@ def normalize_target_dtypes(
                 key: normalize_dtype(value) for key, value in target.items()
             }
 
-            input_feature_names = input.schema.feature_names()
+            input_feature_names = set(input.schema.feature_names())
             for feature_name in feature_name_to_dtype.keys():
                 if feature_name not in input_feature_names:
                     raise ValueError(f"Unknown feature {feature_name!r}")
@@ -13,10 +13,10 @@
 # limitations under the License.
 
 from abc import abstractmethod
-from datetime import datetime, timezone, timedelta
 from typing import Dict
 
 import numpy as np
+import pandas as pd
 
 from temporian.core.operators.calendar.base import BaseCalendarOperator
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
@@ -34,19 +34,13 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
     def __call__(self, sampling: EventSet) -> Dict[str, EventSet]:
         assert isinstance(self.operator, BaseCalendarOperator)
         output_schema = self.output_schema("output")
-        tzinfo = timezone(timedelta(hours=self.operator.utc_offset))
+        utc_offset_seconds = 3600 * self.operator.utc_offset
 
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
         for index_key, index_data in sampling.data.items():
-            value = np.array(
-                [
-                    self._get_value_from_datetime(
-                        datetime.fromtimestamp(ts, tz=tzinfo)
-                    )
-                    for ts in index_data.timestamps
-                ],
-                dtype=np.int32,
+            value = self._get_values_from_timestamps(
+                index_data.timestamps + utc_offset_seconds
             )
 
             dst_evset.set_index_value(
@@ -57,19 +51,34 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
 
         return {"output": dst_evset}
 
+    @staticmethod
+    def _datetimes_from_timestamps(ts: np.ndarray) -> pd.DatetimeIndex:
+        """Converts an array of unix timestamps (in seconds) to a pandas
+        DatetimeIndex, from which calendar fields can be read in vectorized
+        form.
+
+        The conversion goes through second resolution: nanoseconds would
+        silently overflow int64 for timestamps outside of years ~1677-2262.
+        Flooring to whole seconds is exact for every calendar field, and
+        matches datetime.fromtimestamp on negative (pre-epoch) timestamps."""
+        return pd.DatetimeIndex(
+            np.floor(ts).astype(np.int64).astype("datetime64[s]")
+        )
+
     @abstractmethod
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        """Gets the value of the datetime object that corresponds to each
-        specific calendar operator.
+    def _get_values_from_timestamps(self, ts: np.ndarray) -> np.ndarray:
+        """Computes the output feature for a whole array of timestamps.
 
-        For example, calendar_day_of_month will return the datetime's day, and
-        calendar_hour its hour.
+        For example, calendar_day_of_month will return the timestamps' days,
+        and calendar_hour their hours.
 
-        Returned value is converted to int32 by __call__.
+        `ts` contains unix timestamps in seconds, already shifted by the
+        operator's UTC offset, so implementations can read calendar fields
+        as if they were in UTC.
 
         Args:
-            dt: Datetime to get the value from.
+            ts: Timestamps to get the values from.
 
         Returns:
-            Numeric value for the datetime.
+            int32 values for the timestamps.
         """
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+import numpy as np
 
 from temporian.core.operators.calendar.minute import (
     CalendarMinuteOperator,
@@ -29,8 +29,12 @@ class CalendarMinuteNumpyImplementation(BaseCalendarNumpyImplementation):
     def __init__(self, operator: CalendarMinuteOperator) -> None:
         super().__init__(operator)
 
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        return dt.minute
+    def _get_values_from_timestamps(self, ts: np.ndarray) -> np.ndarray:
+        # Minute-of-hour is pure arithmetic on unix seconds: no datetime
+        # objects needed. np.floor matches datetime.fromtimestamp on negative
+        # (pre-epoch) timestamps.
+        seconds = np.floor(ts).astype(np.int64)
+        return ((seconds // 60) % 60).astype(np.int32)
 
 
 implementation_lib.register_operator_implementation(
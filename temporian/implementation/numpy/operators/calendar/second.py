@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+import numpy as np
 
 from temporian.core.operators.calendar.second import (
     CalendarSecondOperator,
@@ -29,8 +29,9 @@ class CalendarSecondNumpyImplementation(BaseCalendarNumpyImplementation):
     def __init__(self, operator: CalendarSecondOperator) -> None:
         super().__init__(operator)
 
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        return dt.second
+    def _get_values_from_timestamps(self, ts: np.ndarray) -> np.ndarray:
+        datetimes = self._datetimes_from_timestamps(ts)
+        return np.asarray(datetimes.second, dtype=np.int32)
 
 
 implementation_lib.register_operator_implementation(
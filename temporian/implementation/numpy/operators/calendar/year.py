@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+import numpy as np
 
 from temporian.core.operators.calendar.year import (
     CalendarYearOperator,
@@ -29,8 +29,9 @@ class CalendarYearNumpyImplementation(BaseCalendarNumpyImplementation):
     def __init__(self, operator: CalendarYearOperator) -> None:
         super().__init__(operator)
 
-    def _get_value_from_datetime(self, dt: datetime) -> int:
-        return dt.year
+    def _get_values_from_timestamps(self, ts: np.ndarray) -> np.ndarray:
+        datetimes = self._datetimes_from_timestamps(ts)
+        return np.asarray(datetimes.year, dtype=np.int32)
 
 
 implementation_lib.register_operator_implementation(
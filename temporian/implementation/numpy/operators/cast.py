@@ -11,14 +11,24 @@ from temporian.implementation.numpy.data.dtype_normalization import (
 from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.operators.base import OperatorImplementation
 
+# Inclusive (min, max) value range of each numeric dtype. Stored as plain
+# Python scalars, built once at import time: comparing data against Python
+# scalars avoids np.iinfo/np.finfo attribute access on every cast.
 _DTYPE_LIMITS = {
-    DType.INT32: np.iinfo(np.int32),
-    DType.INT64: np.iinfo(np.int64),
-    DType.FLOAT32: np.finfo(np.float32),
-    DType.FLOAT64: np.finfo(np.float64),
+    DType.INT32: (int(np.iinfo(np.int32).min), int(np.iinfo(np.int32).max)),
+    DType.INT64: (int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)),
+    DType.FLOAT32: (
+        float(np.finfo(np.float32).min),
+        float(np.finfo(np.float32).max),
+    ),
+    DType.FLOAT64: (
+        float(np.finfo(np.float64).min),
+        float(np.finfo(np.float64).max),
+    ),
 }
 
-_NO_CHECK_TYPES = [DType.BOOLEAN, DType.STRING]
+# Don't check overflow for BOOLEAN or STRING.
+_NO_CHECK_TYPES = frozenset([DType.BOOLEAN, DType.STRING])
 
 
 def _can_overflow(origin_dtype: DType, dst_dtype: DType) -> bool:
@@ -31,7 +41,7 @@ def _can_overflow(origin_dtype: DType, dst_dtype: DType) -> bool:
     """
     if origin_dtype in _NO_CHECK_TYPES or dst_dtype in _NO_CHECK_TYPES:
         return False
-    return _DTYPE_LIMITS[origin_dtype].max > _DTYPE_LIMITS[dst_dtype].max
+    return _DTYPE_LIMITS[origin_dtype][1] > _DTYPE_LIMITS[dst_dtype][1]
 
 
 def _check_overflow(
@@ -41,7 +51,13 @@ def _check_overflow(
     feature_name: str,
     min_max: Tuple,
 ):
-    if np.any((data < min_max[0]) | (data > min_max[1])):
+    if data.size == 0:
+        return
+    # Reductions instead of boolean masks: no O(N) temporaries are
+    # allocated, only two scans over the data. fmin/fmax ignore NaNs, so an
+    # out-of-range value is detected even when the data contains missing
+    # values, while NaNs alone never trigger the check.
+    if np.fmin.reduce(data) < min_max[0] or np.fmax.reduce(data) > min_max[1]:
         raise ValueError(
             f"Overflow when casting feature {feature_name!r} from dtype"
             f" {origin_dtype} to dtype {dst_dtype} {data=}. You can disable"
@@ -49,63 +65,205 @@ def _check_overflow(
         )
 
 
+def _raise_overflow_in_group(
+    index_data,
+    input_schema,
+    output_schema,
+    mins_maxs: List[Optional[Tuple[Any, Any]]],
+    feature_idxs: List[int],
+):
+    """Raises the overflow error for a group whose fused check failed.
+
+    Re-runs the range check feature by feature so that the error message
+    names the offending feature.
+    """
+    for feature_idx in feature_idxs:
+        src_schema = input_schema.features[feature_idx]
+        _check_overflow(
+            index_data.features[feature_idx],
+            src_schema.dtype,
+            output_schema.features[feature_idx].dtype,
+            src_schema.name,
+            mins_maxs[feature_idx],
+        )
+
+
 class CastNumpyImplementation(OperatorImplementation):
     def __init__(self, operator: CastOperator) -> None:
         super().__init__(operator)
+        assert isinstance(operator, CastOperator)
 
-    def __call__(self, input: EventSet) -> Dict[str, EventSet]:
-        assert isinstance(self.operator, CastOperator)
-        output_schema = self.output_schema("output")
-
-        # Reuse evset if actually no features changed dtype
-        if self.operator.is_noop:
-            return {"output": input}
+        # The conversion plan only depends on the schemas, so it is built once
+        # here instead of on every evaluation.
+        if operator.is_noop:
+            return
+        input_features = operator.inputs["input"].schema.features
 
         # Min/max ranges for each of the features. If None, no check is done.
-        mins_maxs: List[Optional[Tuple[Any, Any]]] = []
-        for src_feature, dst_dtype in zip(
-            input.schema.features, self.operator.dtypes
-        ):
-            if self.operator.check_overflow and _can_overflow(
+        self._mins_maxs: List[Optional[Tuple[Any, Any]]] = []
+        for src_feature, dst_dtype in zip(input_features, operator.dtypes):
+            if operator.check_overflow and _can_overflow(
                 src_feature.dtype, dst_dtype
             ):
-                iinfo = _DTYPE_LIMITS[dst_dtype]
-                mins_maxs.append((iinfo.min, iinfo.max))
+                self._mins_maxs.append(_DTYPE_LIMITS[dst_dtype])
             else:
-                mins_maxs.append(None)
+                self._mins_maxs.append(None)
 
         # Numpy output dtype for each feature.
-        np_dtypes = [
-            tp_dtype_to_np_dtype(tp_dtype) for tp_dtype in self.operator.dtypes
+        self._np_dtypes = [
+            tp_dtype_to_np_dtype(tp_dtype) for tp_dtype in operator.dtypes
+        ]
+
+        # Whether the overflow check of each feature can be fused with the
+        # conversion itself. Integer narrowing round-trips exactly, so
+        # out-of-range values are detected by comparing the converted values
+        # with the source ones, saving a separate scan of the data.
+        self._fused_checks = [
+            min_max is not None
+            and src_feature.dtype.is_integer
+            and dst_dtype.is_integer
+            for min_max, src_feature, dst_dtype in zip(
+                self._mins_maxs, input_features, operator.dtypes
+            )
         ]
 
+        # Whether any feature needs a separate pre-conversion overflow scan.
+        # False when overflow checking is disabled or every checked cast is
+        # fused, letting the evaluation skip the scan loop entirely.
+        self._needs_prescan = any(
+            min_max is not None and not fused_check
+            for min_max, fused_check in zip(self._mins_maxs, self._fused_checks)
+        )
+
+        # Features sharing the same (source, target) dtype pair are
+        # concatenated and converted with a single astype call. Strings are
+        # kept on the per-feature path: concatenating would widen each feature
+        # to the group's largest byte width.
+        feature_groups: Dict[Tuple[DType, DType], List[int]] = {}
+        for feature_idx, (src_feature, dst_dtype) in enumerate(
+            zip(input_features, operator.dtypes)
+        ):
+            feature_groups.setdefault(
+                (src_feature.dtype, dst_dtype), []
+            ).append(feature_idx)
+
+        # Specialized plan for each group: whether to batch the conversion and
+        # whether its overflow check is fused are decided here once, so the
+        # conversion loop only runs the conversions.
+        self._group_plans: List[Tuple[List[int], Any, bool, bool]] = []
+        for (src_dtype, dst_dtype), feature_idxs in feature_groups.items():
+            batched = DType.STRING not in (src_dtype, dst_dtype)
+            self._group_plans.append(
+                (
+                    feature_idxs,
+                    self._np_dtypes[feature_idxs[0]],
+                    self._fused_checks[feature_idxs[0]],
+                    batched,
+                )
+            )
+
+    def __call__(self, input: EventSet) -> Dict[str, EventSet]:
+        assert isinstance(self.operator, CastOperator)
+        output_schema = self.output_schema("output")
+
+        # Reuse evset if actually no features changed dtype
+        if self.operator.is_noop:
+            return {"output": input}
+
+        mins_maxs = self._mins_maxs
+        np_dtypes = self._np_dtypes
+        fused_checks = self._fused_checks
+        group_plans = self._group_plans
+
         output_evset = EventSet(data={}, schema=output_schema)
-        for index_key, index_data in input.data.items():
-            dst_features = []
-            for feature_idx, (
-                min_max,
-                np_dtype,
-                src_schema,
-                dst_schema,
-            ) in enumerate(
-                zip(
+        if not input.data:
+            return {"output": output_evset}
+
+        index_items = list(input.data.items())
+
+        # Check overflows feature by feature, so that error messages point at
+        # the offending feature.
+        if self._needs_prescan:
+            for _, index_data in index_items:
+                for (
+                    min_max,
+                    fused_check,
+                    src_schema,
+                    dst_schema,
+                    src_values,
+                ) in zip(
                     mins_maxs,
-                    np_dtypes,
+                    fused_checks,
                     input.schema.features,
                     output_schema.features,
-                )
-            ):
-                src_values = index_data.features[feature_idx]
-                if min_max is not None:
-                    _check_overflow(
-                        src_values,
-                        src_schema.dtype,
-                        dst_schema.dtype,
-                        src_schema.name,
-                        min_max,
-                    )
-                dst_features.append(src_values.astype(np_dtype))
+                    index_data.features,
+                ):
+                    if min_max is not None and not fused_check:
+                        _check_overflow(
+                            src_values,
+                            src_schema.dtype,
+                            dst_schema.dtype,
+                            src_schema.name,
+                            min_max,
+                        )
 
+        num_features = len(np_dtypes)
+        dst_features_per_index: List[List[Optional[np.ndarray]]] = [
+            [None] * num_features for _ in index_items
+        ]
+
+        for feature_idxs, np_dtype, fused_check, batched in group_plans:
+            if batched:
+                # Every index holds the same features, so the group is
+                # concatenated across indexes as well and converted with a
+                # single astype for the whole EventSet. The concatenation pays
+                # for one copy of the source values but replaces one astype
+                # per feature per index (each with a fixed dispatch cost) with
+                # a single one; the per-feature results are contiguous views
+                # into the converted buffer.
+                chunks = [
+                    index_data.features[feature_idx]
+                    for _, index_data in index_items
+                    for feature_idx in feature_idxs
+                ]
+                if len(chunks) == 1:
+                    concatenated = chunks[0]
+                else:
+                    concatenated = np.concatenate(chunks)
+                converted = concatenated.astype(np_dtype)
+                if fused_check and not np.array_equal(converted, concatenated):
+                    for _, index_data in index_items:
+                        _raise_overflow_in_group(
+                            index_data,
+                            input.schema,
+                            output_schema,
+                            mins_maxs,
+                            feature_idxs,
+                        )
+                offset = 0
+                for dst_features, (_, index_data) in zip(
+                    dst_features_per_index, index_items
+                ):
+                    num_events = len(index_data.timestamps)
+                    for feature_idx in feature_idxs:
+                        dst_features[feature_idx] = converted[
+                            offset : offset + num_events
+                        ]
+                        offset += num_events
+            else:
+                # String features are converted one by one: concatenating
+                # would widen each feature to the group's largest byte width.
+                for dst_features, (_, index_data) in zip(
+                    dst_features_per_index, index_items
+                ):
+                    for feature_idx in feature_idxs:
+                        dst_features[feature_idx] = index_data.features[
+                            feature_idx
+                        ].astype(np_dtype)
+
+        for (index_key, index_data), dst_features in zip(
+            index_items, dst_features_per_index
+        ):
             output_evset.set_index_value(
                 index_key,
                 IndexData(
@@ -16,10 +16,11 @@
 """Implementation for the Where operator."""
 
 
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import numpy as np
 from temporian.implementation.numpy.data.dtype_normalization import (
     normalize_features,
+    tp_dtype_to_np_dtype,
 )
 
 from temporian.implementation.numpy.data.event_set import IndexData, EventSet
@@ -33,6 +34,29 @@ class WhereNumpyImplementation(OperatorImplementation):
         assert isinstance(operator, Where)
         super().__init__(operator)
 
+        # Single-value sources are coerced to the output dtype once here, so
+        # that np.where doesn't re-promote them on every index and its result
+        # can be used without normalization.
+        output_np_dtype = tp_dtype_to_np_dtype(
+            self.output_schema("output").features[0].dtype
+        )
+        self._on_true_typed = (
+            None
+            if operator.on_true is None
+            else self._coerce_value(operator.on_true, output_np_dtype)
+        )
+        self._on_false_typed = (
+            None
+            if operator.on_false is None
+            else self._coerce_value(operator.on_false, output_np_dtype)
+        )
+
+    @staticmethod
+    def _coerce_value(value: Any, np_dtype: Any) -> Any:
+        if isinstance(value, str):
+            value = value.encode("UTF-8")
+        return np_dtype(value)
+
     def __call__(
         self,
         input: EventSet,
@@ -41,15 +65,17 @@ class WhereNumpyImplementation(OperatorImplementation):
     ) -> Dict[str, EventSet]:
         assert isinstance(self.operator, Where)
 
-        # Create output EventSet
         output_schema = self.output_schema("output")
-        output_evset = EventSet(data={}, schema=output_schema)
+        output_np_dtype = tp_dtype_to_np_dtype(output_schema.features[0].dtype)
 
         # Single value sources, None if EventSets are provided.
-        on_true_source = self.operator.on_true
-        on_false_source = self.operator.on_false
+        on_true_source = self._on_true_typed
+        on_false_source = self._on_false_typed
 
-        # Fill output EventSet's data
+        # Output EventSet's data. Input index keys are already normalized, so
+        # the whole dict is built directly instead of going through
+        # set_index_value per index.
+        data = {}
         for index_key, index_data in input.data.items():
             # EventSet sources instead of single values
             if on_true is not None:
@@ -60,21 +86,24 @@ class WhereNumpyImplementation(OperatorImplementation):
             feature_values = np.where(
                 index_data.features[0], on_true_source, on_false_source
             )
-            normalized_features = normalize_features(
-                feature_values,
-                self.operator.output_feature_name,
-            )
-
-            output_evset.set_index_value(
-                index_key,
-                IndexData(
-                    features=[normalized_features],
-                    timestamps=index_data.timestamps,
-                    schema=output_schema,
-                ),
+            # np.where already produces the output dtype when both sources
+            # conform to it (e.g. EventSet features); only normalize when a
+            # single-value source promoted the result (e.g. str -> bytes).
+            if feature_values.dtype.type is output_np_dtype:
+                normalized_features = feature_values
+            else:
+                normalized_features = normalize_features(
+                    feature_values,
+                    self.operator.output_feature_name,
+                )
+
+            data[index_key] = IndexData(
+                features=[normalized_features],
+                timestamps=index_data.timestamps,
+                schema=output_schema,
             )
 
-        return {"output": output_evset}
+        return {"output": EventSet(data=data, schema=output_schema)}
 
 
 implementation_lib.register_operator_implementation(